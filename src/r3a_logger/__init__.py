@@ -1,5 +1,6 @@
 """Logging utilities for r3a-minikit."""
 
+from .lazy import Lazy, LazyLoggerAdapter
 from .logger import (
     R3ALogger,
     get_current_logger,
@@ -7,8 +8,13 @@ from .logger import (
     initialize_logging,
     setup_logging,
 )
+from .profiler import CallSiteProfiler, CallSiteStats
 
 __all__ = [
+    "CallSiteProfiler",
+    "CallSiteStats",
+    "Lazy",
+    "LazyLoggerAdapter",
     "R3ALogger",
     "get_current_logger",
     "get_logger",
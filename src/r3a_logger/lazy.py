@@ -0,0 +1,105 @@
+"""Deferred evaluation of expensive log arguments for r3a-minikit."""
+
+import logging
+import operator
+from typing import Any, Callable, Mapping, Optional
+
+_UNSET = object()
+
+
+class Lazy:
+    """A log argument whose value is computed on first use and then cached.
+
+    The wrapped callable only runs when a handler actually formats the
+    record, i.e. after the level check, logger and handler filters have all
+    let it through. The result (or the exception raised) is cached, so a
+    record formatted by several handlers evaluates it at most once.
+    """
+
+    __slots__ = ("_func", "_args", "_kwargs", "_value", "_error")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        """Initialize the lazy value.
+
+        Args:
+            func: Callable producing the value
+            *args: Positional arguments passed to func
+            **kwargs: Keyword arguments passed to func
+        """
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._value: Any = _UNSET
+        self._error: Optional[BaseException] = None
+
+    @property
+    def value(self) -> Any:
+        """The computed value, evaluating the callable on first access."""
+        if self._error is not None:
+            raise self._error
+        if self._value is _UNSET:
+            try:
+                self._value = self._func(*self._args, **self._kwargs)
+            except Exception as e:
+                self._error = e
+                raise
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __index__(self) -> int:
+        return operator.index(self.value)
+
+
+class LazyLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter that defers evaluation of callable message arguments.
+
+    Every callable positional argument (other than a class) is wrapped in a
+    :class:`Lazy`, so ``adapter.debug("state: %s", lambda: dump(state))``
+    costs only a level check when DEBUG is disabled. Pass a :class:`Lazy`
+    directly to supply arguments to the callable, and wrap callables that
+    should be logged as-is in ``Lazy(lambda: func)``.
+    """
+
+    def __init__(
+        self, logger: logging.Logger, extra: Optional[Mapping[str, object]] = None
+    ):
+        """Initialize the adapter.
+
+        Args:
+            logger: The logger to delegate to
+            extra: Optional contextual information for every record
+        """
+        super().__init__(logger, extra or {})
+
+    def log(self, level: int, msg: object, *args: object, **kwargs: Any) -> None:
+        """Log a message, deferring callable arguments until formatting.
+
+        Args:
+            level: Logging level
+            msg: Message format string
+            *args: Message arguments; callables are evaluated lazily
+            **kwargs: Keyword arguments accepted by ``logging.Logger.log``
+        """
+        if self.isEnabledFor(level):
+            msg, log_kwargs = self.process(msg, kwargs)
+            args = tuple(
+                Lazy(arg) if callable(arg) and not isinstance(arg, type) else arg
+                for arg in args
+            )
+            # Skip this frame so funcName/lineno point at the caller
+            log_kwargs["stacklevel"] = log_kwargs.get("stacklevel", 1) + 1
+            self.logger.log(level, msg, *args, **log_kwargs)
@@ -6,6 +6,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
 
+from .lazy import LazyLoggerAdapter
+from .profiler import CallSiteProfiler
+
 # Default format strings
 DEFAULT_FILE_FORMAT: Tuple[str, str] = (
     "%(asctime)s | %(levelname)-8s | %(funcName)s:%(lineno)d | %(message)s",
@@ -34,6 +37,8 @@ class R3ALogger:
         log_file_name: Optional[str] = None,
         file_format: Tuple[str, str] = DEFAULT_FILE_FORMAT,
         console_format: Tuple[str, str] = DEFAULT_CONSOLE_FORMAT,
+        profile: bool = False,
+        profile_max_sites: int = 1024,
     ):
         """Initialize the logger.
 
@@ -48,6 +53,12 @@ class R3ALogger:
                 + ".log".
             file_format: Tuple of (format_string, datefmt) for file output
             console_format: Tuple of (format_string, datefmt) for console output
+            profile: Whether to aggregate per call site record counts, bytes
+                and format/emit time (default: False). Only the handlers set
+                up here are profiled; handlers added later must be passed to
+                ``profiler.instrument()``.
+            profile_max_sites: Maximum number of call sites tracked when
+                profiling is enabled, plus one overflow entry
         """
         self.log_dir = log_dir
         self.log_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -97,6 +108,12 @@ class R3ALogger:
             console_handler.setFormatter(self.console_formatter)
             self.logger.addHandler(console_handler)
 
+        # Setup call-site profiling if enabled
+        self.profiler: Optional[CallSiteProfiler] = None
+        if profile:
+            self.profiler = CallSiteProfiler(max_sites=profile_max_sites)
+            self.profiler.attach(self.logger)
+
     def set_level(self, log_level: str) -> None:
         """Change the logging level.
 
@@ -116,6 +133,14 @@ class R3ALogger:
         """
         return self.logger
 
+    def get_lazy_logger(self) -> LazyLoggerAdapter:
+        """Get the logger wrapped for deferred argument evaluation.
+
+        Returns:
+            A LazyLoggerAdapter around the configured logger
+        """
+        return LazyLoggerAdapter(self.logger)
+
     def cleanup_old_logs(self, days: int = 30) -> None:
         """Clean up log files older than specified days.
 
@@ -127,7 +152,7 @@ class R3ALogger:
         for log_file in self.log_dir.glob("*.log*"):
             if log_file.stat().st_mtime < cutoff_time:
                 log_file.unlink()
-                self.logger.info(f"Cleaned up old log file: {log_file.name}")
+                self.logger.info("Cleaned up old log file: %s", log_file.name)
 
 
 def get_logger(
@@ -239,7 +264,7 @@ def initialize_logging(
         console_format=console_format,
     )
 
-    logger.info(f"Logging initialized at {log_level} level")
+    logger.info("Logging initialized at %s level", log_level)
 
     # Now switch to the desired level if different from INFO
     if log_level != "INFO":
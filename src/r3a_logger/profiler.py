@@ -0,0 +1,210 @@
+"""Call-site profiling for r3a-minikit loggers."""
+
+import json
+import logging
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# A call site is identified by (module, funcName, lineno)
+CallSite = Tuple[str, str, int]
+
+# Key that absorbs new call sites once the table is full
+OVERFLOW_SITE: CallSite = ("<overflow>", "<overflow>", 0)
+
+SORT_KEYS = ("count", "bytes", "format_time", "emit_time")
+
+
+def _seen(local: threading.local, record: logging.LogRecord) -> bool:
+    """Check whether record is the last one stored on local, then store it.
+
+    Only a weak reference is kept so the profiler never extends the lifetime
+    of a record, its arguments or its exception traceback.
+    """
+    last = getattr(local, "record", None)
+    if last is not None and last() is record:
+        return True
+    local.record = weakref.ref(record)
+    return False
+
+
+@dataclass
+class CallSiteStats:
+    """Aggregated cost of a single logging call site."""
+
+    module: str
+    func_name: str
+    lineno: int
+    count: int = 0
+    bytes: int = 0
+    format_time: float = 0.0
+    emit_time: float = 0.0
+
+
+class CallSiteProfiler:
+    """Aggregate log volume and cost per (module, funcName, lineno).
+
+    The profiler wraps each instrumented handler's ``format`` and ``emit`` to
+    count records and measure bytes produced and time spent, so records
+    propagated from child loggers are accounted for as well. Statistics are
+    kept in a bounded table; once ``max_sites`` distinct call sites have been
+    seen, further new sites are folded into a single overflow entry (held in
+    addition to ``max_sites``) so memory stays constant in long-running
+    processes.
+    """
+
+    def __init__(self, max_sites: int = 1024):
+        """Initialize the profiler.
+
+        Args:
+            max_sites: Maximum number of distinct call sites to track, plus
+                one overflow entry
+        """
+        if max_sites < 1:
+            raise ValueError("max_sites must be at least 1")
+        self.max_sites = max_sites
+        self._stats: Dict[CallSite, CallSiteStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _entry(self, record: logging.LogRecord) -> CallSiteStats:
+        """Return the stats entry for a record. Caller must hold the lock."""
+        site = (record.module, record.funcName, record.lineno)
+        entry = self._stats.get(site)
+        if entry is None:
+            if len(self._stats) >= self.max_sites:
+                site = OVERFLOW_SITE
+                entry = self._stats.get(site)
+            if entry is None:
+                entry = CallSiteStats(*site)
+                self._stats[site] = entry
+        return entry
+
+    def attach(self, logger: logging.Logger) -> None:
+        """Start profiling all handlers currently attached to a logger.
+
+        Handlers added to the logger afterwards are not profiled; pass them to
+        :meth:`instrument` to include them.
+
+        Args:
+            logger: The logger whose handlers to instrument
+        """
+        for handler in logger.handlers:
+            self.instrument(handler)
+
+    def instrument(self, handler: logging.Handler) -> None:
+        """Wrap a handler's format and emit methods to record their cost.
+
+        Args:
+            handler: The handler to instrument
+        """
+        if getattr(handler, "_r3a_profiler", None) is self:
+            return
+        handler._r3a_profiler = self  # type: ignore[attr-defined]
+        format_func = self._timed_format(handler.format)
+        emit_func = self._timed_emit(handler.emit)
+        handler.format = format_func  # type: ignore[method-assign, assignment]
+        handler.emit = emit_func  # type: ignore[method-assign, assignment]
+
+    def _timed_format(
+        self, format_func: Callable[[logging.LogRecord], str]
+    ) -> Callable[[logging.LogRecord], str]:
+        # Some handlers (e.g. RotatingFileHandler) format a record more than
+        # once per emit; only the first call counts towards bytes produced.
+        last = threading.local()
+
+        def format(record: logging.LogRecord) -> str:
+            start = time.perf_counter()
+            text = format_func(record)
+            elapsed = time.perf_counter() - start
+            size = 0
+            if not _seen(last, record):
+                size = len(text) if text.isascii() else len(text.encode("utf-8"))
+            # Emit time is reported exclusive of formatting
+            self._local.format_time = getattr(self._local, "format_time", 0.0)
+            self._local.format_time += elapsed
+            with self._lock:
+                entry = self._entry(record)
+                entry.bytes += size
+                entry.format_time += elapsed
+            return text
+
+        return format
+
+    def _timed_emit(
+        self, emit_func: Callable[[logging.LogRecord], None]
+    ) -> Callable[[logging.LogRecord], None]:
+        def emit(record: logging.LogRecord) -> None:
+            self._local.format_time = 0.0
+            start = time.perf_counter()
+            try:
+                emit_func(record)
+            finally:
+                elapsed = time.perf_counter() - start - self._local.format_time
+                self._local.format_time = 0.0
+                # Handlers run in turn on the logging thread; count each
+                # record once no matter how many handlers emit it.
+                counted = _seen(self._local, record)
+                with self._lock:
+                    entry = self._entry(record)
+                    entry.emit_time += max(elapsed, 0.0)
+                    if not counted:
+                        entry.count += 1
+
+        return emit
+
+    def stats(self) -> List[CallSiteStats]:
+        """Get a snapshot of all tracked call sites.
+
+        Returns:
+            Copies of the per-site statistics
+        """
+        with self._lock:
+            entries = list(self._stats.values())
+            return [CallSiteStats(**asdict(entry)) for entry in entries]
+
+    def top(self, n: int = 10, by: str = "bytes") -> List[CallSiteStats]:
+        """Get the most expensive call sites.
+
+        Args:
+            n: Number of call sites to return
+            by: Metric to rank by (count, bytes, format_time, emit_time)
+
+        Returns:
+            Up to n call sites ordered from most to least expensive
+        """
+        if by not in SORT_KEYS:
+            raise ValueError(f"by must be one of {', '.join(SORT_KEYS)}")
+        ranked = sorted(
+            self.stats(), key=lambda entry: getattr(entry, by), reverse=True
+        )
+        return ranked[:n]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the profile to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary with the table bound and every tracked call site
+        """
+        ranked = sorted(self.stats(), key=attrgetter("bytes"), reverse=True)
+        return {
+            "max_sites": self.max_sites,
+            "sites": [asdict(entry) for entry in ranked],
+        }
+
+    def dump_json(self, path: Path) -> None:
+        """Write the profile to a JSON file.
+
+        Args:
+            path: Destination file path
+        """
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,104 @@
+"""Unit tests for lazy.py (Lazy and LazyLoggerAdapter)."""
+
+import logging
+
+from r3a_logger.lazy import Lazy, LazyLoggerAdapter
+from r3a_logger.logger import R3ALogger
+
+
+class Counter:
+    """Callable that records how many times it was evaluated."""
+
+    def __init__(self, value="expensive"):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def read_log(log_dir, name):
+    with open(log_dir / f"{name}.log", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_disabled_level_skips_evaluation(tmp_path):
+    logger_obj = R3ALogger(tmp_path / "logs", log_level="INFO", logger_name="lazy-off")
+    adapter = logger_obj.get_lazy_logger()
+    expensive = Counter()
+    adapter.debug("state: %s", expensive)
+    adapter.debug("state: %s", Lazy(expensive))
+    assert expensive.calls == 0
+
+
+def test_enabled_level_evaluates_once_across_handlers(tmp_path):
+    log_dir = tmp_path / "logs"
+    logger_obj = R3ALogger(
+        log_dir, log_level="DEBUG", console_logging=True, logger_name="lazy-on"
+    )
+    adapter = logger_obj.get_lazy_logger()
+    expensive = Counter("big summary")
+    adapter.debug("state: %s", expensive)
+    assert expensive.calls == 1
+    assert "state: big summary" in read_log(log_dir, "lazy-on")
+
+
+def test_filtered_record_skips_evaluation(tmp_path):
+    logger_obj = R3ALogger(tmp_path / "logs", log_level="DEBUG", logger_name="lazy-f")
+    logger = logger_obj.get_logger()
+    logger.addFilter(lambda record: False)
+    expensive = Counter()
+    LazyLoggerAdapter(logger).info("state: %s", expensive)
+    assert expensive.calls == 0
+
+
+def test_failing_callable_is_evaluated_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    logger_obj = R3ALogger(
+        tmp_path / "logs", console_logging=True, logger_name="lazy-error"
+    )
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise RuntimeError("summary failed")
+
+    logger_obj.get_lazy_logger().info("state: %s", broken)
+    assert len(calls) == 1
+
+
+def test_lazy_supports_format_conversions(tmp_path):
+    log_dir = tmp_path / "logs"
+    logger_obj = R3ALogger(log_dir, log_level="INFO", logger_name="lazy-conv")
+    adapter = logger_obj.get_lazy_logger()
+    adapter.info(
+        "%s %r %d %.1f %x",
+        Lazy(str.upper, "text"),
+        Lazy(lambda: "quoted"),
+        Lazy(len, [1, 2, 3]),
+        Lazy(lambda: 2.25),
+        Lazy(lambda: 255),
+    )
+    assert "TEXT 'quoted' 3 2.2 ff" in read_log(log_dir, "lazy-conv")
+    assert f"{Lazy(lambda: 7):03d}" == "007"
+
+
+def test_classes_and_plain_values_are_not_called(tmp_path):
+    log_dir = tmp_path / "logs"
+    logger_obj = R3ALogger(log_dir, log_level="INFO", logger_name="lazy-plain")
+    adapter = logger_obj.get_lazy_logger()
+    adapter.info("%s %s", int, 5)
+    assert "<class 'int'> 5" in read_log(log_dir, "lazy-plain")
+
+
+def test_adapter_reports_caller_location(tmp_path):
+    logger_obj = R3ALogger(
+        tmp_path / "logs", log_level="INFO", logger_name="lazy-site", profile=True
+    )
+    adapter = logger_obj.get_lazy_logger()
+    adapter.info("from the caller")
+    adapter.log(logging.INFO, "direct log call")
+    assert logger_obj.profiler is not None
+    func_names = {entry.func_name for entry in logger_obj.profiler.stats()}
+    assert func_names == {"test_adapter_reports_caller_location"}
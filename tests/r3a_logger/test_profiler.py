@@ -0,0 +1,187 @@
+"""Unit tests for profiler.py (CallSiteProfiler and R3ALogger profiling)."""
+
+import gc
+import io
+import json
+import logging
+import weakref
+
+import pytest
+
+from r3a_logger.logger import R3ALogger
+from r3a_logger.profiler import OVERFLOW_SITE, CallSiteProfiler
+
+
+def chatty(logger):
+    for i in range(5):
+        logger.info("chatty message %d with some padding", i)
+
+
+def quiet(logger):
+    logger.info("quiet")
+
+
+def test_profiler_disabled_by_default(tmp_path):
+    logger_obj = R3ALogger(tmp_path / "logs", logger_name="profile-off")
+    assert logger_obj.profiler is None
+    for handler in logger_obj.get_logger().handlers:
+        assert "emit" not in vars(handler)
+        assert "format" not in vars(handler)
+
+
+def test_profiler_aggregates_per_call_site(tmp_path):
+    logger_obj = R3ALogger(
+        tmp_path / "logs",
+        console_logging=True,
+        logger_name="profile-sites",
+        profile=True,
+    )
+    logger = logger_obj.get_logger()
+    chatty(logger)
+    quiet(logger)
+    logger.debug("below level, not counted")
+
+    profiler = logger_obj.profiler
+    assert profiler is not None
+    top = profiler.top(1)
+    assert len(top) == 1
+    assert top[0].func_name == "chatty"
+    assert top[0].module == "test_profiler"
+    assert top[0].count == 5
+    # Both the file and console handler produce output for each record
+    assert top[0].bytes > 2 * 5 * len("chatty message 0 with some padding")
+    assert top[0].format_time > 0
+    assert top[0].emit_time > 0
+
+    by_count = {entry.func_name: entry.count for entry in profiler.stats()}
+    assert by_count == {"chatty": 5, "quiet": 1}
+
+
+def test_profiler_counts_utf8_bytes(tmp_path):
+    logger_obj = R3ALogger(
+        tmp_path / "logs",
+        logger_name="profile-utf8",
+        file_format=("%(message)s", "%H:%M:%S"),
+        profile=True,
+    )
+    logger_obj.get_logger().info("ñé")
+    assert logger_obj.profiler is not None
+    assert logger_obj.profiler.stats()[0].bytes == 4
+
+
+def test_profiler_table_is_bounded(tmp_path):
+    logger_obj = R3ALogger(
+        tmp_path / "logs",
+        logger_name="profile-bounded",
+        profile=True,
+        profile_max_sites=1,
+    )
+    logger = logger_obj.get_logger()
+    chatty(logger)
+    quiet(logger)
+    quiet(logger)
+
+    assert logger_obj.profiler is not None
+    sites = {
+        (entry.module, entry.func_name, entry.lineno): entry.count
+        for entry in logger_obj.profiler.stats()
+    }
+    assert len(sites) == 2
+    assert sites[OVERFLOW_SITE] == 2
+
+
+def test_profiler_top_validates_sort_key():
+    profiler = CallSiteProfiler()
+    with pytest.raises(ValueError):
+        profiler.top(by="size")
+    with pytest.raises(ValueError):
+        CallSiteProfiler(max_sites=0)
+
+
+def test_profiler_dump_json_and_reset(tmp_path):
+    logger_obj = R3ALogger(tmp_path / "logs", logger_name="profile-json", profile=True)
+    chatty(logger_obj.get_logger())
+    quiet(logger_obj.get_logger())
+    profiler = logger_obj.profiler
+    assert profiler is not None
+
+    out_file = tmp_path / "profile.json"
+    profiler.dump_json(out_file)
+    data = json.loads(out_file.read_text(encoding="utf-8"))
+    assert data["max_sites"] == 1024
+    assert [site["func_name"] for site in data["sites"]] == ["chatty", "quiet"]
+    assert data["sites"][0]["count"] == 5
+
+    profiler.reset()
+    assert profiler.stats() == []
+
+
+def test_profiler_instruments_handlers_once(tmp_path):
+    logger_obj = R3ALogger(
+        tmp_path / "logs", logger_name="profile-reinit", profile=True
+    )
+    logger = logger_obj.get_logger()
+
+    # Instrumenting the same handler twice must not double count
+    assert logger_obj.profiler is not None
+    logger_obj.profiler.attach(logger)
+    quiet(logger)
+    assert logger_obj.profiler.stats()[0].count == 1
+
+
+def test_profiler_counts_records_from_child_loggers(tmp_path):
+    logger_obj = R3ALogger(
+        tmp_path / "logs",
+        console_logging=True,
+        logger_name="profile-parent",
+        profile=True,
+    )
+    child = logging.getLogger("profile-parent.sub")
+    quiet(child)
+    quiet(child)
+
+    assert logger_obj.profiler is not None
+    stats = logger_obj.profiler.stats()
+    assert len(stats) == 1
+    assert stats[0].count == 2
+    assert stats[0].bytes > 0
+
+
+def test_profiler_ignores_handlers_added_after_attach(tmp_path):
+    logger_obj = R3ALogger(
+        tmp_path / "logs",
+        logger_name="profile-late",
+        file_format=("%(message)s", "%H:%M:%S"),
+        profile=True,
+    )
+    logger = logger_obj.get_logger()
+    late_handler = logging.StreamHandler(io.StringIO())
+    late_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(late_handler)
+    profiler = logger_obj.profiler
+    assert profiler is not None
+
+    # Only the file handler is profiled until the late handler is instrumented
+    quiet(logger)
+    assert (profiler.stats()[0].count, profiler.stats()[0].bytes) == (1, 5)
+
+    profiler.instrument(late_handler)
+    quiet(logger)
+    assert (profiler.stats()[0].count, profiler.stats()[0].bytes) == (2, 15)
+
+
+def test_profiler_does_not_keep_records_alive(tmp_path):
+    logger_obj = R3ALogger(tmp_path / "logs", logger_name="profile-gc", profile=True)
+    logger = logger_obj.get_logger()
+    # Keep pytest's capture handlers from holding on to the record
+    logger.propagate = False
+
+    class Payload:
+        pass
+
+    payload = Payload()
+    payload_ref = weakref.ref(payload)
+    logger.info("payload: %s", payload)
+    del payload
+    gc.collect()
+    assert payload_ref() is None